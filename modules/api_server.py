@@ -0,0 +1,481 @@
+"""
+modules/api_server.py
+Local HTTP/JSON API module for Password Office.
+Serves the generator, strength checker and policy checker to other local
+services over asyncio, bound to localhost or a Unix socket.
+Author: Ogbonna Samuel (0xg0fath3r)
+"""
+
+import os
+import sys
+import json
+import stat
+import signal
+import socket
+import asyncio
+import argparse
+import ipaddress
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dotenv import load_dotenv
+
+from modules.generator import generate_password
+from modules.strength_checker import score_password
+from modules.policy_checker import check_policy
+
+# Load environment variables
+load_dotenv()
+
+# Server settings loaded from .env — falls back to a loopback-only default
+API_HOST    = os.getenv("API_HOST",    "127.0.0.1")
+API_PORT    = int(os.getenv("API_PORT",    8765))
+API_SOCKET  = os.getenv("API_SOCKET",  "")
+API_WORKERS = int(os.getenv("API_WORKERS", os.cpu_count() or 1))
+
+# Request limits
+MAX_BODY_BYTES    = 1024 * 1024
+MAX_HEADERS       = 100
+MAX_BATCH_ITEMS   = 1000
+MAX_GEN_LENGTH    = 1024
+KEEPALIVE_TIMEOUT = 15.0
+
+# Concurrent requests to one endpoint arriving within this window share a worker job
+BATCH_WINDOW = 0.002
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HttpError(Exception):
+    """Request error that maps directly onto an HTTP status code."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# Endpoint handlers — these run inside the worker processes
+def _flag(item, name):
+    """Read an optional boolean field, defaulting to True."""
+    value = item.get(name, True)
+    if not isinstance(value, bool):
+        raise ValueError(f"'{name}' must be true or false.")
+    return value
+
+
+def _password(item):
+    """Read the required 'password' field."""
+    pwd = item.get("password")
+    if not isinstance(pwd, str) or not pwd:
+        raise ValueError("'password' must be a non-empty string.")
+    return pwd
+
+
+def generate_one(item):
+    """Generate a password from a {"length", "upper", "lower", "digits", "symbols"} request."""
+    length = item.get("length", 16)
+    if not isinstance(length, int) or isinstance(length, bool):
+        raise ValueError("'length' must be an integer.")
+    if length > MAX_GEN_LENGTH:
+        raise ValueError(f"Length too long. Maximum is {MAX_GEN_LENGTH} characters.")
+    password = generate_password(length,
+                                 _flag(item, "upper"),
+                                 _flag(item, "lower"),
+                                 _flag(item, "digits"),
+                                 _flag(item, "symbols"))
+    return {"password": password, "length": length}
+
+
+def score_one(item):
+    """Score a {"password"} request."""
+    return score_password(_password(item))
+
+
+def check_one(item):
+    """Check a {"password"} request against the active policy."""
+    return check_policy(_password(item))
+
+
+ENDPOINTS = {
+    "/generate": generate_one,
+    "/strength": score_one,
+    "/policy"  : check_one,
+}
+
+
+def run_batch(path, items):
+    """
+    Run one endpoint over a list of request objects.
+    Invalid items get an {"error": ...} result in place so one bad
+    entry never fails the rest of the batch.
+    Returns: list of result dicts, same order as items
+    """
+    handler = ENDPOINTS[path]
+    results = []
+    for item in items:
+        try:
+            if not isinstance(item, dict):
+                raise ValueError("Each request must be a JSON object.")
+            results.append(handler(item))
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return results
+
+
+# Request batching
+class BatchDispatcher:
+    """
+    Coalesce concurrent requests into one worker-pool job per endpoint.
+    Scoring a single password is far cheaper than shipping it to another
+    process, so items are queued for BATCH_WINDOW seconds (or until
+    MAX_BATCH_ITEMS are waiting) and sent to the pool together.
+    make_pool is called to create the pool, and again to replace it if a
+    worker process dies and breaks it.
+    """
+
+    def __init__(self, make_pool):
+        self.make_pool = make_pool
+        self.pool      = make_pool()
+        self.pending   = {}  # path -> list of (items, future)
+        self.counts    = {}  # path -> number of queued items
+        self.timers    = {}  # path -> TimerHandle for the pending flush
+
+    async def submit(self, path, items):
+        """Queue items for an endpoint and wait for their results."""
+        loop   = asyncio.get_running_loop()
+        future = loop.create_future()
+        bucket = self.pending.setdefault(path, [])
+        bucket.append((items, future))
+        self.counts[path] = self.counts.get(path, 0) + len(items)
+
+        if self.counts[path] >= MAX_BATCH_ITEMS:
+            self._flush(path)
+        elif len(bucket) == 1:
+            self.timers[path] = loop.call_later(BATCH_WINDOW, self._flush, path)
+        return await future
+
+    def _flush(self, path):
+        """Send everything queued for an endpoint to the worker pool."""
+        bucket = self.pending.pop(path, None)
+        self.counts.pop(path, None)
+        # An early flush must not leave its timer to cut the next batch short
+        timer = self.timers.pop(path, None)
+        if timer is not None:
+            timer.cancel()
+        if not bucket:
+            return
+        items = [item for batch, _ in bucket for item in batch]
+        pool  = self.pool
+        try:
+            job = asyncio.get_running_loop().run_in_executor(pool, run_batch, path, items)
+        except Exception as e:
+            # Runs from a timer callback, so an exception here would only be logged
+            self._fail(bucket, pool, e)
+            return
+        job.add_done_callback(lambda done: self._resolve(bucket, pool, done))
+
+    def _resolve(self, bucket, pool, job):
+        """Hand each waiting request its slice of the batch results."""
+        if job.cancelled():
+            self._fail(bucket, pool, RuntimeError("Worker job was cancelled."))
+            return
+        if job.exception() is not None:
+            self._fail(bucket, pool, job.exception())
+            return
+        results = job.result()
+        start   = 0
+        for batch, future in bucket:
+            end = start + len(batch)
+            if not future.done():
+                future.set_result(results[start:end])
+            start = end
+
+    def _fail(self, bucket, pool, error):
+        """Fail every waiting request, replacing the pool if a worker died."""
+        if isinstance(error, BrokenProcessPool) and pool is self.pool:
+            print("[!] A worker process died. Restarting the worker pool.")
+            pool.shutdown(wait=False)
+            self.pool = self.make_pool()
+        for _, future in bucket:
+            if not future.done():
+                future.set_exception(error)
+
+    def close(self):
+        """Shut down the worker pool."""
+        self.pool.shutdown()
+
+
+# HTTP handling
+async def read_request(reader):
+    """
+    Read one HTTP/1.x request from the stream.
+    Returns: (method, path, version, headers, body), or None on a clean EOF
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line.")
+    if not version.startswith("HTTP/1."):
+        raise HttpError(400, "Unsupported HTTP version.")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise asyncio.IncompleteReadError(b"", None)
+        if len(headers) >= MAX_HEADERS:
+            raise HttpError(400, "Too many headers.")
+        name, sep, value = line.decode("latin-1").partition(":")
+        if not sep:
+            raise HttpError(400, "Malformed header.")
+        headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        raise HttpError(400, "Chunked bodies are not supported. Send Content-Length.")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length.")
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length.")
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, f"Body exceeds {MAX_BODY_BYTES} bytes.")
+    body = await reader.readexactly(length) if length else b""
+
+    path = target.split("?", 1)[0]
+    return method.upper(), path, version, headers, body
+
+
+def wants_keep_alive(version, headers):
+    """HTTP/1.1 keeps connections open unless told otherwise; HTTP/1.0 only on request."""
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+def write_response(writer, status, payload, keep_alive):
+    """Serialise a JSON response onto the stream."""
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Cache-Control: no-store\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+async def route(dispatcher, method, path, body):
+    """
+    Dispatch a parsed request.
+    A JSON object body is a single request; a JSON array is a batch.
+    Returns: (status, payload)
+    """
+    if path == "/health":
+        if method != "GET":
+            raise HttpError(405, "Use GET.")
+        return 200, {"status": "ok"}
+
+    if path not in ENDPOINTS:
+        raise HttpError(404, f"Unknown endpoint '{path}'.")
+    if method != "POST":
+        raise HttpError(405, "Use POST.")
+
+    try:
+        data = json.loads(body or b"{}")
+    except (ValueError, UnicodeDecodeError):
+        raise HttpError(400, "Body must be valid JSON.")
+
+    if isinstance(data, list):
+        if len(data) > MAX_BATCH_ITEMS:
+            raise HttpError(413, f"Batch exceeds {MAX_BATCH_ITEMS} items.")
+        if not data:
+            return 200, []
+        return 200, await dispatcher.submit(path, data)
+
+    result = (await dispatcher.submit(path, [data]))[0]
+    if "error" in result and len(result) == 1:
+        raise HttpError(400, result["error"])
+    return 200, result
+
+
+async def handle_connection(dispatcher, reader, writer):
+    """Serve requests on one connection until it closes or goes idle."""
+    try:
+        while True:
+            try:
+                request = await asyncio.wait_for(read_request(reader), KEEPALIVE_TIMEOUT)
+            except HttpError as e:
+                write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+                await writer.drain()
+                break
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError, ValueError, ConnectionError):
+                break
+            if request is None:
+                break
+
+            method, path, version, headers, body = request
+            keep_alive = wants_keep_alive(version, headers)
+            try:
+                status, payload = await route(dispatcher, method, path, body)
+            except HttpError as e:
+                status, payload = e.status, {"error": str(e)}
+            except Exception:
+                status, payload = 500, {"error": "Internal server error."}
+
+            write_response(writer, status, payload, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def _is_socket(path):
+    """True if path exists and is a Unix socket (symlinks are not followed)."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _socket_in_use(path):
+    """True unless connecting to the socket is refused, i.e. nobody is listening."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    except OSError:
+        return True
+    finally:
+        probe.close()
+    return True
+
+
+async def serve(host=API_HOST, port=API_PORT, socket_path=API_SOCKET, workers=API_WORKERS):
+    """
+    Run the API server until cancelled or sent SIGTERM.
+    Returns: False if the server could not start, True on a clean stop
+    """
+    if socket_path:
+        # Only ever clear a stale socket left behind by a previous run
+        if _is_socket(socket_path):
+            if _socket_in_use(socket_path):
+                print(f"[!] {socket_path} is already in use by another process.")
+                return False
+            os.remove(socket_path)
+        elif os.path.lexists(socket_path):
+            print(f"[!] {socket_path} exists and is not a socket. Refusing to replace it.")
+            return False
+
+    dispatcher = BatchDispatcher(partial(ProcessPoolExecutor, max_workers=workers))
+    try:
+        async def on_connect(reader, writer):
+            await handle_connection(dispatcher, reader, writer)
+
+        if socket_path:
+            # Create the socket as 0600 from the start rather than chmod-ing it afterwards
+            old_umask = os.umask(0o177)
+            try:
+                server = await asyncio.start_unix_server(on_connect, path=socket_path)
+            except OSError as e:
+                print(f"[!] Could not bind unix:{socket_path}: {e.strerror or e}")
+                return False
+            finally:
+                os.umask(old_umask)
+            # Remember which socket is ours so cleanup never removes someone else's
+            socket_inode = os.lstat(socket_path).st_ino
+            print(f"[+] Password Office API listening on unix:{socket_path} ({workers} workers)")
+        else:
+            if not _is_loopback(host):
+                print(f"[!] WARNING: {host} is not a loopback address. "
+                      "Passwords will be reachable from the network.")
+            try:
+                server = await asyncio.start_server(on_connect, host=host, port=port)
+            except OSError as e:
+                print(f"[!] Could not bind {host}:{port}: {e.strerror or e}")
+                return False
+            print(f"[+] Password Office API listening on http://{host}:{port} ({workers} workers)")
+
+        # SIGTERM (e.g. from a service manager) stops the server the same way Ctrl+C does
+        loop       = asyncio.get_running_loop()
+        forever    = asyncio.ensure_future(server.serve_forever())
+        terminated = False
+
+        def on_sigterm():
+            nonlocal terminated
+            terminated = True
+            forever.cancel()
+
+        try:
+            loop.add_signal_handler(signal.SIGTERM, on_sigterm)
+        except (NotImplementedError, AttributeError):
+            pass  # no signal handlers on Windows event loops
+
+        try:
+            async with server:
+                await forever
+        except asyncio.CancelledError:
+            if not terminated:
+                raise
+        finally:
+            try:
+                loop.remove_signal_handler(signal.SIGTERM)
+            except (NotImplementedError, AttributeError):
+                pass
+            if socket_path and _is_socket(socket_path) and os.lstat(socket_path).st_ino == socket_inode:
+                os.remove(socket_path)
+    finally:
+        dispatcher.close()
+    return True
+
+
+def _is_loopback(host):
+    """True if host names the local machine only."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Password Office local HTTP/JSON API")
+    parser.add_argument("--host",    default=API_HOST,    help="TCP host to bind (default: %(default)s)")
+    parser.add_argument("--port",    default=API_PORT,    type=int, help="TCP port (default: %(default)s)")
+    parser.add_argument("--socket",  default=API_SOCKET,  help="Unix socket path; overrides --host/--port")
+    parser.add_argument("--workers", default=API_WORKERS, type=int, help="Worker processes (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    try:
+        if not asyncio.run(serve(args.host, args.port, args.socket, max(1, args.workers))):
+            return 1
+    except KeyboardInterrupt:
+        print()
+    print("[*] API server stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,36 @@ Generates a cryptographically random password of user-specified length.
 Author: Ogbonna Samuel (0xg0fath3r)
 """
 
-import random
+import secrets
 import string
 
+MIN_LENGTH = 4
+
+
+def generate_password(length, use_upper=True, use_lower=True, use_digits=True, use_symbols=True):
+    """
+    Generate a random password of the given length.
+    Falls back to all character types if every set is excluded.
+    Raises ValueError if length is below MIN_LENGTH.
+    Returns: str password
+    """
+    if length < MIN_LENGTH:
+        raise ValueError(f"Length too short. Minimum is {MIN_LENGTH} characters.")
+
+    # Build character pool
+    chars = ""
+    if use_upper:   chars += string.ascii_uppercase
+    if use_lower:   chars += string.ascii_lowercase
+    if use_digits:  chars += string.digits
+    if use_symbols: chars += string.punctuation
+
+    # Fallback if everything was excluded
+    if not chars:
+        chars = string.ascii_letters + string.digits + string.punctuation
+
+    # secrets draws from the OS, so forked worker processes never share state
+    return "".join(secrets.choice(chars) for _ in range(length))
+
 
 # Method for password generation
 def generator_interface():
@@ -22,13 +49,13 @@ def generator_interface():
 
     # Prompt for password length
     try:
-        length = int(input("\n[?] Enter password length (min 4): ").strip())
+        length = int(input(f"\n[?] Enter password length (min {MIN_LENGTH}): ").strip())
     except ValueError:
         print("[!] Invalid input. Please enter a number.\n")
         return
 
-    if length < 4:
-        print("[!] Length too short. Minimum is 4 characters.\n")
+    if length < MIN_LENGTH:
+        print(f"[!] Length too short. Minimum is {MIN_LENGTH} characters.\n")
         return
 
     # Ask user what character sets to include
@@ -38,20 +65,12 @@ def generator_interface():
     use_digits  = input("    Digits?            (Y/n): ").strip().lower() != "n"
     use_symbols = input("    Symbols?           (Y/n): ").strip().lower() != "n"
 
-    # Build character pool
-    chars = ""
-    if use_upper:   chars += string.ascii_uppercase
-    if use_lower:   chars += string.ascii_lowercase
-    if use_digits:  chars += string.digits
-    if use_symbols: chars += string.punctuation
-
-    # Fallback if user excluded everything
-    if not chars:
+    # Warn if user excluded everything
+    if not (use_upper or use_lower or use_digits or use_symbols):
         print("[!] No character types selected. Using all characters by default.\n")
-        chars = string.ascii_letters + string.digits + string.punctuation
 
     # Generate password
-    password = "".join(random.choice(chars) for _ in range(length))
+    password = generate_password(length, use_upper, use_lower, use_digits, use_symbols)
 
     # Display result
     print("\n" + "-" * 50)
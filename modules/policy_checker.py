@@ -8,6 +8,8 @@ Author: Ogbonna Samuel (0xg0fath3r)
 import os
 from dotenv import load_dotenv
 
+from modules.strength_checker import analyze_composition
+
 # Load environment variables
 load_dotenv()
 
@@ -20,6 +22,31 @@ REQUIRE_DIGIT   =     os.getenv("POLICY_REQUIRE_DIGIT",   "true").lower()  == "t
 REQUIRE_SYMBOL  =     os.getenv("POLICY_REQUIRE_SYMBOL",  "true").lower()  == "true"
 
 
+def check_composition(comp):
+    """
+    Evaluate a composition from analyze_composition() against the active policy.
+    Returns: dict mapping each rule description to True/False
+    """
+    length = comp["length"]
+    return {
+        f"At least {MIN_LENGTH} characters"    : length >= MIN_LENGTH,
+        f"No more than {MAX_LENGTH} characters": length <= MAX_LENGTH,
+        "Contains uppercase letter"            : comp["has_upper"]  if REQUIRE_UPPER  else True,
+        "Contains lowercase letter"            : comp["has_lower"]  if REQUIRE_LOWER  else True,
+        "Contains a digit"                     : comp["has_digit"]  if REQUIRE_DIGIT  else True,
+        "Contains a symbol"                    : comp["has_symbol"] if REQUIRE_SYMBOL else True,
+    }
+
+
+def check_policy(pwd):
+    """
+    Check a password against the active policy without any prompts.
+    Returns: dict with overall "passed" flag and per-rule "rules" results
+    """
+    rules = check_composition(analyze_composition(pwd))
+    return {"passed": all(rules.values()), "rules": rules}
+
+
 def policy_interface():
     """
     Check a password against the active security policy.
@@ -43,15 +70,8 @@ def policy_interface():
         print("[!] No password entered.\n")
         return
 
-    # Define checks based on policy
-    checks = {
-        f"At least {MIN_LENGTH} characters"    : len(pwd) >= MIN_LENGTH,
-        f"No more than {MAX_LENGTH} characters": len(pwd) <= MAX_LENGTH,
-        "Contains uppercase letter"            : any(c.isupper() for c in pwd) if REQUIRE_UPPER  else True,
-        "Contains lowercase letter"            : any(c.islower() for c in pwd) if REQUIRE_LOWER  else True,
-        "Contains a digit"                     : any(c.isdigit() for c in pwd) if REQUIRE_DIGIT  else True,
-        "Contains a symbol"                    : any(not c.isalnum() for c in pwd) if REQUIRE_SYMBOL else True,
-    }
+    # Evaluate checks based on policy
+    checks = check_policy(pwd)["rules"]
 
     # Print results
     print("\n" + "-" * 50)
@@ -6,6 +6,66 @@ Author: Ogbonna Samuel (0xg0fath3r)
 """
 
 
+MAX_SCORE = 7
+
+
+def analyze_composition(pwd):
+    """
+    Break a password down into its length and character classes.
+    Returns: dict with length, has_upper, has_lower, has_digit, has_symbol
+    """
+    return {
+        "length"    : len(pwd),
+        "has_upper" : any(c.isupper() for c in pwd),
+        "has_lower" : any(c.islower() for c in pwd),
+        "has_digit" : any(c.isdigit() for c in pwd),
+        "has_symbol": any(not c.isalnum() for c in pwd),
+    }
+
+
+def score_composition(comp):
+    """Score a composition from analyze_composition() on a 0-MAX_SCORE scale."""
+    length = comp["length"]
+    score  = 0
+    if length >= 8:          score += 1
+    if length >= 12:         score += 1  # bonus for longer passwords
+    if length >= 16:         score += 1  # bonus for very long passwords
+    if comp["has_upper"]:    score += 1
+    if comp["has_lower"]:    score += 1
+    if comp["has_digit"]:    score += 1
+    if comp["has_symbol"]:   score += 1
+    return score
+
+
+def rate_score(score):
+    """
+    Map a score to its strength label.
+    Returns: (strength, icon, tip)
+    """
+    if score <= 2:
+        return ("WEAK", "[✘]",
+                "Add uppercase, digits, and symbols. Use at least 8 characters.")
+    if score <= 4:
+        return ("MEDIUM", "[~]",
+                "Good start! Try making it longer and adding more character types.")
+    if score <= 6:
+        return ("STRONG", "[✔]",
+                "Great password! Consider going even longer for extra security.")
+    return ("VERY STRONG", "[★]",
+            "Excellent! This is a very secure password.")
+
+
+def score_password(pwd):
+    """
+    Evaluate password strength without any prompts.
+    Returns: dict with the composition plus score, max_score, strength and tip
+    """
+    comp  = analyze_composition(pwd)
+    score = score_composition(comp)
+    strength, _, tip = rate_score(score)
+    return dict(comp, score=score, max_score=MAX_SCORE, strength=strength, tip=tip)
+
+
 def strength_checker_interface():
     """
     Evaluate password strength based on multiple criteria:
@@ -24,48 +84,19 @@ def strength_checker_interface():
         print("[!] No password entered.\n")
         return
 
-    # Analyze composition
-    length     = len(pwd)
-    has_upper  = any(c.isupper() for c in pwd)
-    has_lower  = any(c.islower() for c in pwd)
-    has_digit  = any(c.isdigit() for c in pwd)
-    has_symbol = any(not c.isalnum() for c in pwd)
-
-    # Scoring system
-    score = 0
-    if length >= 8:   score += 1
-    if length >= 12:  score += 1  # bonus for longer passwords
-    if length >= 16:  score += 1  # bonus for very long passwords
-    if has_upper:     score += 1
-    if has_lower:     score += 1
-    if has_digit:     score += 1
-    if has_symbol:    score += 1
-
-    # Map score to strength label
-    if score <= 2:
-        strength = "WEAK"
-        icon     = "[✘]"
-        tip      = "Add uppercase, digits, and symbols. Use at least 8 characters."
-    elif score <= 4:
-        strength = "MEDIUM"
-        icon     = "[~]"
-        tip      = "Good start! Try making it longer and adding more character types."
-    elif score <= 6:
-        strength = "STRONG"
-        icon     = "[✔]"
-        tip      = "Great password! Consider going even longer for extra security."
-    else:
-        strength = "VERY STRONG"
-        icon     = "[★]"
-        tip      = "Excellent! This is a very secure password."
+    # Analyze and score
+    comp  = analyze_composition(pwd)
+    score = score_composition(comp)
+    strength, icon, tip = rate_score(score)
+    length = comp["length"]
 
     # Display results
     print("\n" + "-" * 50)
-    print(f"  {icon} Strength : {strength}  (score: {score}/7)")
+    print(f"  {icon} Strength : {strength}  (score: {score}/{MAX_SCORE})")
     print("-" * 50)
     print(f"  Length   : {length} chars    {'✔' if length >= 8 else '✘'}")
-    print(f"  Uppercase: {'✔' if has_upper  else '✘'}   Lowercase: {'✔' if has_lower  else '✘'}")
-    print(f"  Digits   : {'✔' if has_digit  else '✘'}   Symbols  : {'✔' if has_symbol else '✘'}")
+    print(f"  Uppercase: {'✔' if comp['has_upper'] else '✘'}   Lowercase: {'✔' if comp['has_lower'] else '✘'}")
+    print(f"  Digits   : {'✔' if comp['has_digit'] else '✘'}   Symbols  : {'✔' if comp['has_symbol'] else '✘'}")
     print("-" * 50)
     print(f"  Tip: {tip}")
     print("-" * 50 + "\n")
@@ -0,0 +1,435 @@
+"""
+modules/wordlist_analyzer.py
+Wordlist Analytics module for Password Office.
+Streams a large password corpus in chunks across worker processes and
+reports length, character-class, strength and policy statistics plus the
+most frequent base words, using bounded-memory sketches.
+Author: Ogbonna Samuel (0xg0fath3r)
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import string
+import hashlib
+import argparse
+import re
+from array import array
+from operator import add
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from modules.strength_checker import analyze_composition, score_composition, rate_score, MAX_SCORE
+from modules.policy_checker import check_composition
+
+# Streaming settings
+CHUNK_BYTES = 8 * 1024 * 1024
+TOP_N       = 20
+
+# Sketch sizes — memory stays fixed no matter how large the corpus is
+CMS_WIDTH     = 1 << 16
+CMS_DEPTH     = 4
+HLL_PRECISION = 14
+
+# Each chunk nominates this many of its own most common words per reported slot
+CANDIDATES_PER_SLOT = 10
+
+# Base word extraction: trim digits/symbols off the ends, then undo common leetspeak.
+# A leading "@" or "$" is kept since it usually stands in for a letter ("@dmin"),
+# and so, sometimes, is a trailing TRAIL_LEET character (see base_word).
+BASE_STRIP   = string.digits + string.punctuation + string.whitespace
+LEAD_STRIP   = BASE_STRIP.replace("@", "").replace("$", "")
+LEET_MAP     = str.maketrans("@4310$5!7", "aaeiossit")
+TRAIL_LEET   = "@$30"
+MIN_BASE_LEN = 3
+
+DIGIT_RE = re.compile(r"[0-9]")
+
+
+def hash_all(texts):
+    """
+    Yield a stable 64-bit hash for each string in texts.
+    Python's built-in hash() is salted per process, so it cannot be used
+    for sketches that are built in workers and merged in the parent.
+    """
+    blake2b, from_bytes = hashlib.blake2b, int.from_bytes
+    for text in texts:
+        yield from_bytes(blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+def hash64(text):
+    """Stable 64-bit hash of a single string."""
+    return next(hash_all((text,)))
+
+
+# Bounded-memory sketches
+class CountMinSketch:
+    """Approximate frequency counts in CMS_DEPTH x CMS_WIDTH counters."""
+
+    def __init__(self, width=CMS_WIDTH, depth=CMS_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.table = array("Q", bytes(8 * width * depth))
+
+    def _slots(self, h):
+        # Double hashing: row i uses h1 + i*h2, offset into its own row
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, text, count=1):
+        self.update({text: count})
+
+    def update(self, counts):
+        """Add every (text, count) pair from a Counter."""
+        table = self.table
+        for h, count in zip(hash_all(counts), counts.values()):
+            for slot in self._slots(h):
+                table[slot] += count
+
+    def estimate(self, text):
+        """Never under-counts; over-counts by at most ~e/width of the total."""
+        return min(self.table[slot] for slot in self._slots(hash64(text)))
+
+    def merge(self, other):
+        self.table = array("Q", map(add, self.table, other.table))
+
+
+class HyperLogLog:
+    """Approximate distinct counts in 2**HLL_PRECISION one-byte registers."""
+
+    def __init__(self, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, text):
+        self.update((text,))
+
+    def update(self, texts):
+        """Add every string in an iterable."""
+        registers = self.registers
+        shift     = 64 - self.precision
+        mask      = (1 << shift) - 1
+        for h in hash_all(texts):
+            index = h >> shift
+            # Rank = position of the first set bit in the remaining bits
+            rank  = shift - (h & mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge(self, other):
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self):
+        m     = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw   = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        # Small-range correction: linear counting is more accurate here
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+# Per-chunk work — runs inside the worker processes
+def base_word(pwd):
+    """
+    Reduce a password to its dictionary root, e.g. "P@ssw0rd123!" -> "password".
+    Trailing digits and symbols are dropped ("password$" -> "password"). One
+    trailing TRAIL_LEET character is read as a letter instead when the rest
+    of the word is already leetspeak and no digit follows it ("l0v3" -> "love",
+    "h3ll0!" -> "hello", but "sh@d0w30" -> "shadow"). If stripping would leave
+    too little, the whole trailing TRAIL_LEET run is kept ("p@$$" -> "pass").
+    This is a heuristic: "p@ssw0rd0" still reads as "passwordo".
+    Returns: str, or None if too little is left
+    """
+    word = pwd.lstrip(LEAD_STRIP).lower()
+    body = word.rstrip(BASE_STRIP)
+    tail = word[len(body):]
+    run  = tail[:len(tail) - len(tail.lstrip(TRAIL_LEET))]
+    if len(body) < MIN_BASE_LEN:
+        body += run
+    elif run and body.translate(LEET_MAP) != body and not tail[1:2].isdigit():
+        body += run[0]
+    word = body.translate(LEET_MAP)
+    return word if len(word) >= MIN_BASE_LEN else None
+
+
+def composition_key(pwd):
+    """Return (length, has_upper, has_lower, has_digit, has_symbol) for a password."""
+    if pwd.isascii():
+        # For ASCII these string-level checks match the per-character ones exactly
+        has_symbol = not pwd.isalnum()
+        return (len(pwd),
+                pwd != pwd.lower(),
+                pwd != pwd.upper(),
+                DIGIT_RE.search(pwd) is not None if has_symbol else not pwd.isalpha(),
+                has_symbol)
+    comp = analyze_composition(pwd)
+    return (comp["length"], comp["has_upper"], comp["has_lower"], comp["has_digit"], comp["has_symbol"])
+
+
+def analyze_chunk(block, top_n=TOP_N):
+    """
+    Analyze one newline-terminated block of a wordlist.
+    Returns: dict of mergeable partial results
+    """
+    text = block.decode("utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    passwords = Counter(text.split("\n"))
+    passwords.pop("", None)
+
+    compositions = Counter()
+    base_words   = Counter()
+    for pwd, count in passwords.items():
+        compositions[composition_key(pwd)] += count
+        word = base_word(pwd)
+        if word:
+            base_words[word] += count
+
+    unique_pw   = HyperLogLog()
+    unique_base = HyperLogLog()
+    sketch      = CountMinSketch()
+    unique_pw.update(passwords)
+    unique_base.update(base_words)
+    sketch.update(base_words)
+
+    return {
+        "lines"       : sum(passwords.values()),
+        "compositions": compositions,
+        "sketch"      : sketch,
+        "unique_pw"   : unique_pw,
+        "unique_base" : unique_base,
+        "candidates"  : [w for w, _ in base_words.most_common(top_n * CANDIDATES_PER_SLOT)],
+    }
+
+
+# Streaming pipeline
+def read_chunks(stream, chunk_bytes=CHUNK_BYTES):
+    """
+    Yield blocks of roughly chunk_bytes that always end on a line boundary.
+    A line longer than chunk_bytes is skipped rather than buffered, so one
+    unterminated line (or a binary file) cannot grow memory without bound.
+    """
+    tail     = b""
+    skipping = False
+    skipped  = 0
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        if skipping:
+            # Drop the rest of the oversized line
+            start = block.find(b"\n")
+            if start == -1:
+                continue
+            block    = block[start + 1:]
+            skipping = False
+        block = tail + block
+        cut   = block.rfind(b"\n")
+        if cut == -1:
+            if len(block) > chunk_bytes:
+                tail     = b""
+                skipping = True
+                skipped += 1
+            else:
+                tail = block
+            continue
+        tail = block[cut + 1:]
+        yield block[:cut + 1]
+    if tail and not skipping:
+        yield tail
+    if skipped:
+        print(f"[!] Skipped {skipped} line(s) longer than {chunk_bytes:,} bytes. "
+              "Is this a binary file?", file=sys.stderr)
+
+
+def bounded_map(pool, func, items, limit, *args):
+    """
+    Like pool.map() but yields results as they finish and only keeps
+    `limit` chunks in flight, so reading never runs ahead of the workers.
+    """
+    pending = set()
+    for item in items:
+        if len(pending) >= limit:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(pool.submit(func, item, *args))
+    for future in pending:
+        yield future.result()
+
+
+def analyze_stream(stream, workers=None, top_n=TOP_N, chunk_bytes=CHUNK_BYTES):
+    """
+    Run the full analysis over a binary stream in one pass.
+    Returns: report dict (see build_report)
+    """
+    workers      = workers or os.cpu_count() or 1
+    lines        = 0
+    compositions = Counter()
+    sketch       = CountMinSketch()
+    unique_pw    = HyperLogLog()
+    unique_base  = HyperLogLog()
+    candidates   = set()
+    max_candidates = top_n * CANDIDATES_PER_SLOT
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = read_chunks(stream, chunk_bytes)
+        for part in bounded_map(pool, analyze_chunk, chunks, workers * 2, top_n):
+            lines += part["lines"]
+            compositions.update(part["compositions"])
+            sketch.merge(part["sketch"])
+            unique_pw.merge(part["unique_pw"])
+            unique_base.merge(part["unique_base"])
+            candidates.update(part["candidates"])
+            # Keep the candidate set bounded by dropping the weakest ones
+            if len(candidates) > 2 * max_candidates:
+                ranked     = sorted(candidates, key=sketch.estimate, reverse=True)
+                candidates = set(ranked[:max_candidates])
+
+    top_words = sorted(((w, sketch.estimate(w)) for w in candidates),
+                       key=lambda pair: (-pair[1], pair[0]))[:top_n]
+    return build_report(lines, compositions, unique_pw.estimate(), unique_base.estimate(), top_words)
+
+
+# Report building
+def class_label(has_upper, has_lower, has_digit, has_symbol):
+    """Name a character-class combination, e.g. "lower+digit"."""
+    names = [name for name, present in (("upper", has_upper), ("lower", has_lower),
+                                        ("digit", has_digit), ("symbol", has_symbol)) if present]
+    return "+".join(names) or "none"
+
+
+def build_report(lines, compositions, unique_passwords, unique_base_words, top_words):
+    """
+    Derive every histogram from the merged composition counts.
+    Scoring and policy only depend on length and character classes, so
+    each distinct composition is evaluated once rather than once per line.
+    """
+    lengths      = Counter()
+    classes      = Counter()
+    scores       = Counter()
+    policy_rules = Counter()
+    policy_all   = 0
+
+    for key, count in compositions.items():
+        comp = dict(zip(("length", "has_upper", "has_lower", "has_digit", "has_symbol"), key))
+        lengths[comp["length"]] += count
+        classes[class_label(*key[1:])] += count
+        scores[score_composition(comp)] += count
+        rules = check_composition(comp)
+        for rule, passed in rules.items():
+            policy_rules[rule] += count if passed else 0
+        if all(rules.values()):
+            policy_all += count
+
+    return {
+        "lines"            : lines,
+        "unique_passwords" : unique_passwords,
+        "unique_base_words": unique_base_words,
+        "lengths"          : dict(sorted(lengths.items())),
+        "char_classes"     : dict(classes.most_common()),
+        "strength_scores"  : {score: scores.get(score, 0) for score in range(MAX_SCORE + 1)},
+        "policy_pass"      : dict(policy_rules),
+        "policy_pass_all"  : policy_all,
+        "top_base_words"   : top_words,
+    }
+
+
+def _pct(part, whole):
+    return 100.0 * part / whole if whole else 0.0
+
+
+def _bar(part, whole, width=20):
+    return "#" * round(width * part / whole) if whole else ""
+
+
+def print_report(report, source, elapsed, size=None):
+    """Display a report in the same layout as the other Password Office tools."""
+    total = report["lines"]
+
+    print("\n" + "=" * 50)
+    print("          WORDLIST ANALYTICS")
+    print("=" * 50)
+    print(f"\n  Source            : {source}")
+    print(f"  Passwords         : {total:,}")
+    print(f"  Unique passwords  : ~{report['unique_passwords']:,}")
+    print(f"  Unique base words : ~{report['unique_base_words']:,}")
+    rate = f"  ({size / elapsed / 1e6:.1f} MB/s)" if size and elapsed else ""
+    print(f"  Elapsed           : {elapsed:.2f}s{rate}")
+
+    print("\n" + "-" * 50)
+    print("  LENGTH DISTRIBUTION")
+    print("-" * 50)
+    for length, count in report["lengths"].items():
+        print(f"  {length:>4}  {count:>12,}  {_pct(count, total):5.1f}%  {_bar(count, total)}")
+
+    print("\n" + "-" * 50)
+    print("  CHARACTER CLASSES")
+    print("-" * 50)
+    for label, count in report["char_classes"].items():
+        print(f"  {label:<24} {count:>12,}  {_pct(count, total):5.1f}%")
+
+    print("\n" + "-" * 50)
+    print("  STRENGTH SCORES")
+    print("-" * 50)
+    for score, count in report["strength_scores"].items():
+        label = rate_score(score)[0]
+        print(f"  {score}/{MAX_SCORE} {label:<12} {count:>12,}  {_pct(count, total):5.1f}%  {_bar(count, total)}")
+
+    print("\n" + "-" * 50)
+    print("  POLICY PASS RATES")
+    print("-" * 50)
+    for rule, count in report["policy_pass"].items():
+        print(f"  {rule:<38} {_pct(count, total):5.1f}%")
+    print(f"  {'All rules':<38} {_pct(report['policy_pass_all'], total):5.1f}%")
+
+    print("\n" + "-" * 50)
+    print(f"  TOP {len(report['top_base_words'])} BASE WORDS (approximate counts)")
+    print("-" * 50)
+    for rank, (word, count) in enumerate(report["top_base_words"], start=1):
+        print(f"  [{rank:>2}] {word:<30} ~{count:,}")
+    print("-" * 50 + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Password Office wordlist analytics")
+    parser.add_argument("wordlist", help="Path to a newline-separated wordlist, or - for stdin")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: %(default)s)")
+    parser.add_argument("--top", type=int, default=TOP_N,
+                        help="Number of base words to report (default: %(default)s)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_BYTES // (1024 * 1024),
+                        help="Chunk size in MB handed to each worker (default: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.wordlist != "-" and not os.path.isfile(args.wordlist):
+        print(f"[!] Wordlist not found: {args.wordlist}")
+        return 1
+
+    start = time.time()
+    if args.wordlist == "-":
+        size   = None
+        report = analyze_stream(sys.stdin.buffer, max(1, args.workers), max(1, args.top),
+                                max(1, args.chunk_mb) * 1024 * 1024)
+    else:
+        size = os.path.getsize(args.wordlist)
+        with open(args.wordlist, "rb") as f:
+            report = analyze_stream(f, max(1, args.workers), max(1, args.top),
+                                    max(1, args.chunk_mb) * 1024 * 1024)
+    elapsed = time.time() - start
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.wordlist, elapsed, size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+tests/test_api_server.py
+Tests for the local HTTP/JSON API: batch handling, request parsing and
+request coalescing in BatchDispatcher.
+"""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from modules import api_server
+from modules.api_server import BatchDispatcher, HttpError, read_request, route, run_batch
+
+
+def parse(raw):
+    """Run read_request() over raw bytes."""
+    async def go():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await read_request(reader)
+    return asyncio.run(go())
+
+
+# run_batch
+def test_run_batch_isolates_bad_items():
+    results = run_batch("/strength", [{"password": "Abcdef1!"}, {"password": ""}, "nope", {}])
+    assert results[0]["score"] == 5
+    assert results[1] == {"error": "'password' must be a non-empty string."}
+    assert results[2] == {"error": "Each request must be a JSON object."}
+    assert "error" in results[3]
+
+
+def test_run_batch_generate_validates_fields():
+    ok, short, long_, flag = run_batch("/generate", [
+        {"length": 12, "symbols": False},
+        {"length": 2},
+        {"length": api_server.MAX_GEN_LENGTH + 1},
+        {"length": 12, "upper": "yes"},
+    ])
+    assert len(ok["password"]) == 12 and ok["password"].isalnum()
+    assert "too short" in short["error"]
+    assert "too long" in long_["error"]
+    assert "'upper'" in flag["error"]
+
+
+# read_request
+def test_read_request_parses_body_and_headers():
+    method, path, version, headers, body = parse(
+        b"post /policy?x=1 HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}")
+    assert (method, path, version, body) == ("POST", "/policy", "HTTP/1.1", b"{}")
+    assert headers["connection"] == "close"
+
+
+def test_read_request_clean_eof():
+    assert parse(b"") is None
+
+
+@pytest.mark.parametrize("raw, status", [
+    (b"GARBAGE\r\n\r\n", 400),
+    (b"GET / HTTP/2\r\n\r\n", 400),
+    (b"GET / HTTP/1.1\r\nno-colon\r\n\r\n", 400),
+    (b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 400),
+    (b"POST / HTTP/1.1\r\nContent-Length: abc\r\n\r\n", 400),
+    (b"POST / HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (api_server.MAX_BODY_BYTES + 1), 413),
+])
+def test_read_request_rejects(raw, status):
+    with pytest.raises(HttpError) as err:
+        parse(raw)
+    assert err.value.status == status
+
+
+def test_read_request_truncated_body():
+    with pytest.raises(asyncio.IncompleteReadError):
+        parse(b"POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\nshort")
+
+
+# BatchDispatcher
+def test_dispatcher_coalesces_and_slices(monkeypatch):
+    calls = []
+
+    def counting_run_batch(path, items):
+        calls.append(len(items))
+        return run_batch(path, items)
+
+    monkeypatch.setattr(api_server, "run_batch", counting_run_batch)
+
+    async def go():
+        dispatcher = BatchDispatcher(lambda: ThreadPoolExecutor(1))
+        batches = [[{"password": "a"}], [{"password": "Bb1!"}, {"password": ""}], [{"password": "c" * 16}]]
+        results = await asyncio.gather(*(dispatcher.submit("/strength", b) for b in batches))
+        dispatcher.close()
+        return results
+
+    first, second, third = asyncio.run(go())
+    assert calls == [4]
+    assert [r["length"] for r in first] == [1]
+    assert second[0]["length"] == 4 and "error" in second[1]
+    assert [r["length"] for r in third] == [16]
+
+
+def test_dispatcher_early_flush_cancels_timer(monkeypatch):
+    monkeypatch.setattr(api_server, "MAX_BATCH_ITEMS", 3)
+
+    async def go():
+        dispatcher = BatchDispatcher(lambda: ThreadPoolExecutor(1))
+        first = asyncio.ensure_future(dispatcher.submit("/strength", [{"password": "a"}] * 2))
+        await asyncio.sleep(0)
+        timer = dispatcher.timers["/strength"]
+        await dispatcher.submit("/strength", [{"password": "b"}] * 2)
+        await first
+        dispatcher.close()
+        return timer, dispatcher.timers
+
+    timer, timers = asyncio.run(go())
+    assert timer.cancelled()
+    assert timers == {}
+
+
+def test_dispatcher_failed_job_fails_all_waiters(monkeypatch):
+    def boom(path, items):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(api_server, "run_batch", boom)
+
+    async def go():
+        dispatcher = BatchDispatcher(lambda: ThreadPoolExecutor(1))
+        results = await asyncio.gather(dispatcher.submit("/policy", [{"password": "a"}]),
+                                       dispatcher.submit("/policy", [{"password": "b"}]),
+                                       return_exceptions=True)
+        dispatcher.close()
+        return results
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(go()))
+
+
+def test_dispatcher_cancelled_job_fails_waiters():
+    async def go():
+        dispatcher = BatchDispatcher(lambda: ThreadPoolExecutor(1))
+        waiter = asyncio.get_running_loop().create_future()
+        job    = asyncio.get_running_loop().create_future()
+        job.cancel()
+        dispatcher._resolve([([{}], waiter)], dispatcher.pool, job)
+        dispatcher.close()
+        return waiter
+
+    waiter = asyncio.run(go())
+    with pytest.raises(RuntimeError):
+        waiter.result()
+
+
+class BrokenOnSubmit:
+    """Executor that behaves like a pool whose worker was killed."""
+
+    def __init__(self, at_submit):
+        self.at_submit = at_submit
+
+    def submit(self, fn, *args):
+        if self.at_submit:
+            raise BrokenProcessPool("worker died")
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+@pytest.mark.parametrize("at_submit", [True, False])
+def test_dispatcher_replaces_broken_pool(at_submit):
+    pools = [BrokenOnSubmit(at_submit), ThreadPoolExecutor(1)]
+
+    async def go():
+        dispatcher = BatchDispatcher(lambda: pools.pop(0))
+        with pytest.raises(BrokenProcessPool):
+            await dispatcher.submit("/strength", [{"password": "a"}])
+        recovered = await dispatcher.submit("/strength", [{"password": "a"}])
+        dispatcher.close()
+        return recovered
+
+    assert asyncio.run(go())[0]["length"] == 1
+    assert pools == []
+
+
+# route
+def test_route_errors():
+    async def go(method, path, body=b""):
+        dispatcher = BatchDispatcher(lambda: ThreadPoolExecutor(1))
+        try:
+            return await route(dispatcher, method, path, body)
+        except HttpError as e:
+            return e.status, str(e)
+        finally:
+            dispatcher.close()
+
+    assert asyncio.run(go("GET", "/health")) == (200, {"status": "ok"})
+    assert asyncio.run(go("GET", "/nope"))[0] == 404
+    assert asyncio.run(go("GET", "/strength"))[0] == 405
+    assert asyncio.run(go("POST", "/strength", b"{bad"))[0] == 400
+    assert asyncio.run(go("POST", "/strength", b'{"password": ""}'))[0] == 400
+    assert asyncio.run(go("POST", "/strength", b"[]")) == (200, [])
@@ -0,0 +1,127 @@
+"""
+tests/test_wordlist_analyzer.py
+Tests for wordlist analytics: base word extraction, chunked reading,
+character-class fast path and the bounded-memory sketches.
+"""
+
+import io
+import random
+import string
+
+import pytest
+
+from modules.strength_checker import analyze_composition
+from modules.wordlist_analyzer import (CountMinSketch, HyperLogLog, analyze_chunk, analyze_stream,
+                                       base_word, composition_key, read_chunks)
+
+
+# base_word
+@pytest.mark.parametrize("pwd, expected", [
+    # plain suffixes are stripped
+    ("password123",  "password"),
+    ("password!",    "password"),
+    ("password$",    "password"),
+    ("Password@",    "password"),
+    ("summer@",      "summer"),
+    ("love$$",       "love"),
+    ("dragon00",     "dragon"),
+    # leetspeak inside the word is undone
+    ("P@ssw0rd123!", "password"),
+    ("p@ssw0rd1",    "password"),
+    ("s3cr3t",       "secret"),
+    ("@dmin",        "admin"),
+    ("$hadow!!",     "shadow"),
+    ("l0v3r!",       "lover"),
+    # one trailing leet letter on a leetspeak word
+    ("l0v3",         "love"),
+    ("h3ll0",        "hello"),
+    ("h3ll0!",       "hello"),
+    # ...but not when it runs into a number
+    ("h3ll0123",     "hell"),
+    ("l0ve300",      "love"),
+    ("dr@g0n00",     "dragon"),
+    ("sh@d0w30",     "shadow"),
+    # too short without the trailing run
+    ("p@$$",         "pass"),
+    ("hi1",          None),
+    ("123456",       None),
+])
+def test_base_word(pwd, expected):
+    assert base_word(pwd) == expected
+
+
+# read_chunks
+def chunks(data, chunk_bytes):
+    return list(read_chunks(io.BytesIO(data), chunk_bytes))
+
+
+def test_read_chunks_end_on_line_boundaries():
+    data = b"".join(b"line%d\n" % i for i in range(100))
+    parts = chunks(data, 16)
+    assert b"".join(parts) == data
+    assert all(part.endswith(b"\n") for part in parts)
+
+
+def test_read_chunks_keeps_missing_final_newline():
+    assert b"".join(chunks(b"one\ntwo\nlast", 5)) == b"one\ntwo\nlast"
+
+
+def test_read_chunks_skips_oversized_line(capsys):
+    data = b"ok\n" + b"x" * 50 + b"\nafter\nlast"
+    assert b"".join(chunks(data, 8)) == b"ok\nafter\nlast"
+    assert "Skipped 1 line" in capsys.readouterr().err
+
+
+def test_read_chunks_oversized_unterminated_line(capsys):
+    assert chunks(b"y" * 50, 8) == []
+    assert "Skipped 1 line" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("chunk_bytes", [11, 12, 13])
+def test_crlf_input_is_counted_like_lf(chunk_bytes):
+    # These sizes make reads end between "\r" and "\n"
+    data  = b"Password1\r\nhello\r\n\r\nPassword1\r\n"
+    parts = chunks(data, chunk_bytes)
+    assert b"".join(parts) == data
+    assert all(part.endswith(b"\r\n") for part in parts)
+    result = analyze_chunk(data)
+    assert result["lines"] == 3
+    assert result["compositions"] == analyze_chunk(data.replace(b"\r\n", b"\n"))["compositions"]
+
+
+# composition_key
+def test_composition_key_matches_analyze_composition():
+    rng   = random.Random(0)
+    chars = string.printable + "äÖß١٢日本"
+    for _ in range(5000):
+        pwd  = "".join(rng.choice(chars) for _ in range(rng.randint(1, 8)))
+        comp = analyze_composition(pwd)
+        assert composition_key(pwd) == (comp["length"], comp["has_upper"], comp["has_lower"],
+                                        comp["has_digit"], comp["has_symbol"])
+
+
+# Sketches
+def test_count_min_never_undercounts():
+    sketch = CountMinSketch(width=64, depth=4)
+    counts = {f"w{i}": i + 1 for i in range(200)}
+    sketch.update(counts)
+    assert all(sketch.estimate(word) >= count for word, count in counts.items())
+
+
+def test_hyperloglog_estimate_and_merge():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(str(i) for i in range(30000))
+    right.update(str(i) for i in range(20000, 50000))
+    left.merge(right)
+    assert abs(left.estimate() - 50000) < 50000 * 0.05
+
+
+# End to end
+def test_analyze_stream_report():
+    data = b"\n".join([b"P@ssw0rd1"] * 5 + [b"dragon99"] * 3 + [b"Tr0ub4dor&3"])
+    report = analyze_stream(io.BytesIO(data), workers=1, top_n=2, chunk_bytes=16)
+    assert report["lines"] == 9
+    assert report["unique_passwords"] == 3
+    assert report["lengths"] == {8: 3, 9: 5, 11: 1}
+    assert report["top_base_words"] == [("password", 5), ("dragon", 3)]
+    assert sum(report["strength_scores"].values()) == 9